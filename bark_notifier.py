@@ -1,16 +1,72 @@
 """Bark消息推送模块"""
 import asyncio
-import aiohttp
-from typing import List, Optional
+import json
+import logging
+import sys
+from typing import TYPE_CHECKING, List, Optional
 from datetime import datetime
 from models import Token
 
+if TYPE_CHECKING:
+    import aiohttp
+
+_log = logging.getLogger("bark_notifier")
+
+
+def enable_debug_logging():
+    """开启本模块的调试日志，输出到标准输出（由程序入口在调试模式下调用一次）"""
+    # 根日志器已配置时 basicConfig 不做任何事，不会重复输出
+    logging.basicConfig(stream=sys.stdout, format="%(message)s")
+    _log.setLevel(logging.DEBUG)
+
+# 预先构造的JSON编码器和请求头，避免每次推送重复创建
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
+# 百分号编码查找表：非保留字符(ALPHA/DIGIT/-._~)原样输出，其余字节编码为%XX
+_UNRESERVED_BYTES = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~"
+_UNRESERVED = frozenset(_UNRESERVED_BYTES)
+_PCT = [bytes([i]) if i in _UNRESERVED else b"%%%02X" % i for i in range(256)]
+
+
+def _pct_encode(s: str) -> str:
+    """URL百分号编码，等价于 urllib.parse.quote(s, safe='')"""
+    data = s.encode("utf-8")
+    # 快速路径：删除所有非保留字符后为空，说明无需编码
+    if not data.translate(None, _UNRESERVED_BYTES):
+        return s
+    return b"".join([_PCT[b] for b in data]).decode("ascii")
+
+
 class BarkNotifier:
     """Bark消息推送器"""
     
-    def __init__(self, endpoint: str, debug: bool = False):
+    def __init__(self, endpoint: str):
         self.endpoint = endpoint.rstrip('/')
-        self.debug = debug
+        self._session: Optional["aiohttp.ClientSession"] = None
+    
+    async def __aenter__(self) -> "BarkNotifier":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """获取共享的HTTP会话（首次使用时创建），复用连接池避免每次推送都重新握手"""
+        if self._session is None or self._session.closed:
+            # 延迟导入：未配置Bark时不加载aiohttp
+            import aiohttp
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300, keepalive_timeout=60),
+            )
+        return self._session
+    
+    async def aclose(self):
+        """关闭共享的HTTP会话"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
         
     def is_enabled(self) -> bool:
         """检查Bark推送是否已配置"""
@@ -22,59 +78,56 @@ class BarkNotifier:
         优先使用 POST JSON，避免URL长度限制导致的截断；当 POST 失败时回退到 GET。
         """
         if not self.is_enabled():
-            if self.debug:
-                print("⚠️ Bark端点未配置，跳过推送")
+            _log.debug("⚠️ Bark端点未配置，跳过推送")
             return False
         
+        debug = _log.isEnabledFor(logging.DEBUG)
         try:
-            async with aiohttp.ClientSession() as session:
-                # 先尝试 POST JSON 到 {endpoint}
-                try:
-                    if self.debug:
-                        print(f"📱 发送Bark推送(POST): {self.endpoint}")
-                        preview = body if len(body) <= 100 else body[:100] + "..."
-                        print(f"📝 标题: {title} | 内容预览: {preview}")
-                    payload = {"title": title, "body": body}
-                    async with session.post(self.endpoint, json=payload, timeout=10) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            if self.debug:
-                                print(f"✅ Bark推送成功(POST): {result}")
-                            return True
-                        else:
-                            if self.debug:
-                                print(f"⚠️ POST失败，状态码: {response.status}，尝试GET回退")
-                except asyncio.TimeoutError:
-                    print("❌ Bark推送超时(POST)")
-                except Exception as e:
-                    if self.debug:
-                        print(f"⚠️ POST异常，尝试GET回退: {e}")
-
-                # GET 回退: {endpoint}/{title}/{body}
-                import urllib.parse
-                encoded_title = urllib.parse.quote(title, safe='')
-                encoded_body = urllib.parse.quote(body, safe='')
-                url = f"{self.endpoint}/{encoded_title}/{encoded_body}"
-                if self.debug:
-                    print(f"📱 发送Bark推送(GET回退): {url}")
-                async with session.get(url, timeout=10) as response:
+            session = await self._get_session()
+            # 先尝试 POST JSON 到 {endpoint}
+            try:
+                if debug:
+                    _log.debug("📱 发送Bark推送(POST): %s", self.endpoint)
+                    preview = body if len(body) <= 100 else body[:100] + "..."
+                    _log.debug("📝 标题: %s | 内容预览: %s", title, preview)
+                body_bytes = _JSON_ENCODER.encode({"title": title, "body": body}).encode("utf-8")
+                async with session.post(self.endpoint, data=body_bytes, headers=_JSON_HEADERS) as response:
                     if response.status == 200:
-                        result = await response.json()
-                        if self.debug:
-                            print(f"✅ Bark推送成功(GET): {result}")
+                        # 只在调试时解码响应；否则仅读取字节以便连接回到连接池复用
+                        if debug:
+                            _log.debug("✅ Bark推送成功(POST): %s", await response.text())
+                        else:
+                            await response.read()
                         return True
                     else:
-                        print(f"❌ Bark推送失败，状态码: {response.status}")
-                        return False
-                        
+                        _log.debug("⚠️ POST失败，状态码: %s，尝试GET回退", response.status)
+            except asyncio.TimeoutError:
+                print("❌ Bark推送超时(POST)")
+            except Exception as e:
+                _log.debug("⚠️ POST异常，尝试GET回退: %s", e)
+
+            # GET 回退: {endpoint}/{title}/{body}
+            encoded_title = _pct_encode(title)
+            encoded_body = _pct_encode(body)
+            url = f"{self.endpoint}/{encoded_title}/{encoded_body}"
+            _log.debug("📱 发送Bark推送(GET回退): %s", url)
+            async with session.get(url) as response:
+                if response.status == 200:
+                    if debug:
+                        _log.debug("✅ Bark推送成功(GET): %s", await response.text())
+                    else:
+                        await response.read()
+                    return True
+                else:
+                    print(f"❌ Bark推送失败，状态码: {response.status}")
+                    return False
+                    
         except asyncio.TimeoutError:
             print("❌ Bark推送超时")
             return False
         except Exception as e:
             print(f"❌ Bark推送异常: {e}")
-            if self.debug:
-                import traceback
-                traceback.print_exc()
+            _log.debug("异常详情", exc_info=True)
             return False
     
     async def send_startup_message(self, tokens: List[Token]) -> bool:
@@ -84,10 +137,11 @@ class BarkNotifier:
             body = "监控器已启动，当前没有新代币"
         else:
             title = "🚀 Spark监控器启动"
-            body = f"监控器已启动，当前最新的{len(tokens)}个代币:\n"
+            body_lines = [f"监控器已启动，当前最新的{len(tokens)}个代币:"]
             for i, token in enumerate(tokens, 1):
-                body += f"{i}. {token.name} ({token.ticker})\n"
-                body += f"   合约地址: {token.token_address}\n"
+                body_lines.append(f"{i}. {token.name} ({token.ticker})")
+                body_lines.append(f"   合约地址: {token.token_address}")
+            body = "\n".join(body_lines)
         
         return await self.send_message(title, body)
     
@@ -96,9 +150,9 @@ class BarkNotifier:
         if not tokens:
             return False
 
-        any_success = False
+        title = "🎉 发现新代币"
+        payloads = []
         for token in tokens:
-            title = "🎉 发现新代币"
             body_lines = [
                 f"代币名称: {token.name}",
                 f"代币符号: {token.ticker}",
@@ -107,9 +161,11 @@ class BarkNotifier:
             ]
             if token.description:
                 body_lines.append(f"描述: {token.description}")
-            body = "\n".join(body_lines)
-
-            sent = await self.send_message(title, body)
-            any_success = any_success or sent
+            payloads.append((title, "\n".join(body_lines)))
 
-        return any_success
\ No newline at end of file
+        # 并发发送，共享会话的连接池限制了并发连接数
+        results = await asyncio.gather(
+            *(self.send_message(t, b) for t, b in payloads),
+            return_exceptions=True,
+        )
+        return any(r is True for r in results)
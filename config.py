@@ -1,4 +1,5 @@
 """配置文件"""
+import functools
 import os
 from dataclasses import dataclass
 from typing import Optional
@@ -10,7 +11,25 @@ try:
 except ImportError:
     print("警告: python-dotenv 未安装，将直接使用环境变量")
 
-@dataclass
+# 视为"真"的环境变量取值
+_ENV_TRUE = {"true", "1", "yes", "on"}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_values() -> dict:
+    """读取并解析环境变量（只解析一次，结果被缓存）"""
+    env = os.environ
+    return {
+        "monitor_url": env.get("MONITOR_URL", "https://regtest.luminex.pages.dev/spark/pulse"),
+        "api_url": env.get("API_URL", "https://brc20-api.luminex.io/regtest/spark/pulse"),
+        "browser_headless": env.get("BROWSER_HEADLESS", "false").lower() in _ENV_TRUE,
+        "browser_cdp_url": env.get("BROWSER_CDP_URL", ""),
+        "timezone_offset_hours": int(env.get("TIMEZONE_OFFSET_HOURS", "8")),
+        "bark_endpoint": env.get("BARK_ENDPOINT", ""),
+        "bark_push_on_startup": env.get("BARK_PUSH_ON_STARTUP", "true").lower() in _ENV_TRUE,
+    }
+
+@dataclass(slots=True)
 class Config:
     """应用配置类"""
     # 监控的网页URL
@@ -22,6 +41,9 @@ class Config:
     # 浏览器是否可见（调试用）
     browser_headless: bool = False
     
+    # 现有Chrome的CDP地址（如 http://127.0.0.1:9222），为空则每次启动新浏览器
+    browser_cdp_url: str = ""
+    
     # 时区偏移（小时）
     timezone_offset_hours: int = 8
     
@@ -32,11 +54,5 @@ class Config:
     @classmethod
     def from_env(cls) -> "Config":
         """从环境变量加载配置"""
-        return cls(
-            monitor_url=os.getenv("MONITOR_URL", "https://regtest.luminex.pages.dev/spark/pulse"),
-            api_url=os.getenv("API_URL", "https://brc20-api.luminex.io/regtest/spark/pulse"),
-            browser_headless=os.getenv("BROWSER_HEADLESS", "false").lower() == "true",
-            timezone_offset_hours=int(os.getenv("TIMEZONE_OFFSET_HOURS", "8")),
-            bark_endpoint=os.getenv("BARK_ENDPOINT", ""),
-            bark_push_on_startup=os.getenv("BARK_PUSH_ON_STARTUP", "true").lower() == "true",
-        )
\ No newline at end of file
+        # 每次返回新实例，调用方可以安全地修改（如命令行参数覆盖）
+        return cls(**_load_env_values())
@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 """演示版本 - 使用本地JSON数据模拟功能"""
 import asyncio
-import json
+import sys
 from datetime import datetime
+import orjson
 from config import Config
 from models import Token, TokenStore
+from bark_notifier import BarkNotifier, enable_debug_logging
+
+
+def _ts() -> str:
+    """当前时间戳（用于进度输出）"""
+    return datetime.now().strftime('%H:%M:%S')
 
 class SparkScraperDemo:
     """Spark代币监控爬虫演示版"""
@@ -12,12 +19,14 @@ class SparkScraperDemo:
     def __init__(self, config: Config):
         self.config = config
         self.token_store = TokenStore()
+        # 推送器在两次模拟检查之间共享同一个HTTP会话
+        self.notifier = BarkNotifier(config.bark_endpoint)
     
     def load_demo_data(self) -> list:
         """加载演示数据"""
         try:
-            with open('resp.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open('resp.json', 'rb') as f:
+                data = orjson.loads(f.read())
                 return data.get('data', [])
         except Exception as e:
             print(f"加载演示数据失败: {e}")
@@ -28,21 +37,16 @@ class SparkScraperDemo:
         if not api_data:
             return []
         
-        new_tokens = []
-        
+        tokens = []
         for item in api_data:
             try:
-                token = Token.from_api_data(item)
-                
-                # 检查是否是新代币
-                if self.token_store.is_new_token(token):
-                    new_tokens.append(token)
-                    
+                tokens.append(Token.from_api_data(item))
             except Exception as e:
                 print(f"处理代币数据失败: {e}")
                 continue
         
-        return new_tokens
+        # 一次性筛选出未见过的代币
+        return self.token_store.filter_new_tokens(tokens)
     
     def print_new_tokens(self, tokens: list):
         """打印新代币信息"""
@@ -50,17 +54,18 @@ class SparkScraperDemo:
             print("没有发现新代币")
             return
         
-        print(f"\n🎉 发现 {len(tokens)} 个代币:")
-        print("-" * 80)
-        
+        # 整体拼接后一次性写出
+        sep = "-" * 80
+        lines = [f"\n🎉 发现 {len(tokens)} 个代币:", sep]
         for token in tokens:
-            print(f"代币名称: {token.name}")
-            print(f"代币符号: {token.ticker}")
-            print(f"合约地址: {token.token_address}")
-            print(f"创建时间: {token.token_created_at}")
+            lines.append(f"代币名称: {token.name}")
+            lines.append(f"代币符号: {token.ticker}")
+            lines.append(f"合约地址: {token.token_address}")
+            lines.append(f"创建时间: {token.token_created_at}")
             if token.description:
-                print(f"描述: {token.description}")
-            print("-" * 80)
+                lines.append(f"描述: {token.description}")
+            lines.append(sep)
+        sys.stdout.write("\n".join(lines) + "\n")
     
     async def run_demo(self):
         """运行演示"""
@@ -69,7 +74,7 @@ class SparkScraperDemo:
         print("=" * 80)
         
         # 加载演示数据
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] 加载演示数据...")
+        print(f"[{_ts()}] 加载演示数据...")
         api_data = self.load_demo_data()
         
         if not api_data:
@@ -78,19 +83,26 @@ class SparkScraperDemo:
         
         print(f"✅ 加载了 {len(api_data)} 个代币数据")
         
-        # 模拟首次运行 - 所有代币都是新的
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] 首次运行 - 所有代币都是新的...")
-        new_tokens = self.process_tokens(api_data)
-        self.print_new_tokens(new_tokens[:5])  # 只显示前5个
-        
-        if len(new_tokens) > 5:
-            print(f"... 还有 {len(new_tokens) - 5} 个代币未显示\n")
-        
-        # 模拟第二次运行 - 没有新代币
-        print(f"\n[{datetime.now().strftime('%H:%M:%S')}] 模拟第二次检查...")
-        await asyncio.sleep(2)
-        new_tokens_2nd = self.process_tokens(api_data)
-        self.print_new_tokens(new_tokens_2nd)
+        async with self.notifier:
+            # 模拟首次运行 - 所有代币都是新的
+            print(f"[{_ts()}] 首次运行 - 所有代币都是新的...")
+            new_tokens = self.process_tokens(api_data)
+            self.print_new_tokens(new_tokens[:5])  # 只显示前5个
+            
+            if len(new_tokens) > 5:
+                print(f"... 还有 {len(new_tokens) - 5} 个代币未显示\n")
+            
+            if self.notifier.is_enabled() and self.config.bark_push_on_startup:
+                await self.notifier.send_startup_message(new_tokens[:5])
+            
+            # 模拟第二次运行 - 没有新代币
+            print(f"\n[{_ts()}] 模拟第二次检查...")
+            await asyncio.sleep(2)
+            new_tokens_2nd = self.process_tokens(api_data)
+            self.print_new_tokens(new_tokens_2nd)
+            
+            if new_tokens_2nd and self.notifier.is_enabled():
+                await self.notifier.send_new_token_message(new_tokens_2nd)
         
         print(f"\n✅ 演示完成!")
         print("💡 这展示了程序如何识别新代币并避免重复报告")
@@ -98,6 +110,9 @@ class SparkScraperDemo:
 async def main():
     """主函数"""
     config = Config.from_env()
+    # 演示模式在配置了Bark端点时输出推送调试日志
+    if config.bark_endpoint:
+        enable_debug_logging()
     scraper = SparkScraperDemo(config)
     await scraper.run_demo()
 
@@ -1,22 +1,58 @@
 """爬虫核心逻辑"""
 import argparse
 import asyncio
-import json
+import signal
+import sys
 import time
-from datetime import datetime
 from typing import List, Optional
+import orjson
 from config import Config
 from models import Token, TokenStore
-from bark_notifier import BarkNotifier
+from bark_notifier import BarkNotifier, enable_debug_logging
+
+# 新币API响应合并窗口：窗口内到达的多次响应合并为一次处理
+BATCH_WINDOW_SECONDS = 0.2
+BATCH_MAX_RESPONSES = 10
+
+# 单次浏览器抓取的时间预算：页面加载（毫秒）和等待新币API响应（秒），超时后改用直接API调用
+BROWSER_GOTO_TIMEOUT_MS = 30000
+API_WAIT_TIMEOUT_SECONDS = 8
+
+# 监听模式启动时的时间预算：首次加载页面（毫秒）和等待首个新币API响应（秒），超时后继续监听
+STARTUP_GOTO_TIMEOUT_MS = 60000
+STARTUP_API_WAIT_SECONDS = 10
+
+# 触发优雅退出的信号
+SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+# 代币列表分隔线
+_SEP = "-" * 80 + "\n"
+
+# 监控只依赖API请求，这些资源类型直接拦截以加快页面加载
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet", "texttrack"})
 
 try:
     from playwright.async_api import async_playwright
-    import requests
+    import aiohttp
 except ImportError as e:
     print(f"缺少依赖包: {e}")
     print("请运行: uv sync 安装所有依赖")
 
 
+# 新币查询载荷中必然出现的JSON字符串，用于解析前的快速字节过滤（不受空格和键顺序影响）
+NEW_CATEGORY_MARKER = b'"new"'
+
+
+def _is_new_category(post_data: Optional[bytes]) -> bool:
+    """判断请求载荷是否为新币查询（先按字节快速过滤，再解析JSON严格判断）"""
+    if post_data is None or NEW_CATEGORY_MARKER not in post_data:
+        return False
+    try:
+        return orjson.loads(post_data).get("category") == "new"
+    except Exception:
+        return False
+
+
 class SparkScraper:
     """Spark代币监控爬虫"""
     
@@ -28,15 +64,37 @@ class SparkScraper:
         self.page = None
         self.is_first_run = True
         self.initial_new_coin_data = None
+        self.api_response_data = None
+        self._api_ready = asyncio.Event()  # 捕获到新币API响应时置位
         self.debug = debug  # 调试模式标志
+        self._ts_cache = (0, "")  # (秒级时间戳, 格式化后的时间)
+        self._pending_batch: List[list] = []  # 等待合并处理的API数据
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._bark_sem = asyncio.Semaphore(4)  # 限制同时进行的Bark推送数
+        self._bg_tasks: set[asyncio.Task] = set()  # 后台推送任务，防止被提前回收
+        self._shutdown = asyncio.Event()  # 收到退出信号时置位
+        self._listener_bound = False  # 响应监听器是否已绑定到当前页面
+        self._cdp_connected = False  # 是否通过CDP连接到已在运行的Chrome
+        self._new_requests = set()  # 已发出、尚未收到响应的新币API请求
+        self.api_wait_timeouts = 0  # 浏览器方式等待API响应超时的次数
+        
+        # 直接调用API使用的异步HTTP会话（首次使用时创建），保持连接复用
+        self._http: Optional[aiohttp.ClientSession] = None
         
         # 初始化Bark推送器
-        self.bark_notifier = BarkNotifier(config.bark_endpoint, debug=debug)
+        self.bark_notifier = BarkNotifier(config.bark_endpoint)
         if self.bark_notifier.is_enabled():
             print(f"📱 Bark推送已启用: {config.bark_endpoint}")
         elif debug:
             print("📱 Bark推送未配置")
     
+    def _ts(self) -> str:
+        """当前时间的 %H:%M:%S 格式，同一秒内复用格式化结果"""
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime('%H:%M:%S', time.localtime(now)))
+        return self._ts_cache[1]
+    
     async def init_browser(self):
         """初始化浏览器（仅一次）"""
         if self.browser is None:
@@ -46,6 +104,15 @@ class SparkScraper:
             
             playwright = await async_playwright().start()
             
+            # 优先连接已在运行的Chrome（复用进程和默认上下文的缓存、Cookie），失败时再启动新浏览器
+            if self.config.browser_cdp_url:
+                try:
+                    self.browser = await playwright.chromium.connect_over_cdp(self.config.browser_cdp_url)
+                    self._cdp_connected = True
+                    print(f"🔗 已连接到现有浏览器: {self.config.browser_cdp_url}")
+                except Exception as e:
+                    print(f"⚠️ 连接现有浏览器失败，改为启动新浏览器: {e}")
+            
             # 无头模式添加更多启动参数
             if self.config.browser_headless:
                 browser_args = [
@@ -63,81 +130,32 @@ class SparkScraper:
             if self.debug:
                 print(f"🚀 启动参数: {browser_args}")
             
-            self.browser = await playwright.chromium.launch(
-                headless=self.config.browser_headless,
-                args=browser_args
-            )
-            self.context = await self.browser.new_context(
-                # 无头模式设置用户代理
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
+            if self.browser is None:
+                self.browser = await playwright.chromium.launch(
+                    headless=self.config.browser_headless,
+                    args=browser_args
+                )
+            if self._cdp_connected and self.browser.contexts:
+                # 复用现有Chrome的默认上下文：new_context 会创建空白的隐身上下文，拿不到其缓存和Cookie；
+                # 也不在这里拦截资源，route 会关闭HTTP缓存并影响用户自己的页面
+                self.context = self.browser.contexts[0]
+            else:
+                self.context = await self.browser.new_context(
+                    # 无头模式设置用户代理
+                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+                )
+                # 拦截图片、字体等与监控无关的资源
+                await self.context.route("**/*", self._handle_route)
             self.page = await self.context.new_page()
             
-            # 设置网络请求监听器
-            async def handle_response(response):
-                if self.config.api_url in response.url:
-                    try:
-                        # 获取请求的载荷
-                        request = response.request
-                        post_data = request.post_data
-                        
-                        if self.debug:
-                            print(f"🌐 检测到API请求: {response.url}")
-                            print(f"📦 请求载荷: {post_data}")
-                            print(f"📊 响应状态: {response.status}")
-                        
-                        # 检查是否是新币请求
-                        if post_data and '"category":"new"' in post_data:
-                            print(f"🔍 捕获到新币API请求")
-                            data = await response.json()
-                            api_data = data.get("data", [])
-                            print(f"📈 新币数据：包含 {len(api_data)} 个代币")
-                            
-                            # 如果是初始化阶段，立即处理并显示前3个代币
-                            if self.is_first_run and len(api_data) > 0:
-                                print("📊 首次启动，显示最新3个代币...")
-                                
-                                # 解析所有代币
-                                all_tokens = []
-                                for item in api_data:
-                                    try:
-                                        token = Token.from_api_data(item)
-                                        all_tokens.append(token)
-                                        # 标记为已见过
-                                        self.token_store.add_token(token)
-                                    except Exception as e:
-                                        print(f"处理代币数据失败: {e}")
-                                        continue
-                                
-                                # 显示最新的3个
-                                if all_tokens:
-                                    sorted_tokens = sorted(all_tokens, key=lambda x: x.token_created_at, reverse=True)
-                                    display_tokens = sorted_tokens[:3]
-                                    print(f"\n🪙 当前最新的 {len(display_tokens)} 个代币:")
-                                    self._print_token_list(display_tokens)
-                                    
-                                    # 发送启动推送（如果配置了）
-                                    if self.bark_notifier.is_enabled() and self.config.bark_push_on_startup:
-                                        asyncio.create_task(self._send_startup_notification(display_tokens))
-                                
-                                # 切换到监听模式
-                                self.is_first_run = False
-                                print("✨ 初始化完成，切换到监听模式")
-                            
-                            # 如果是正常监听模式，检查新代币
-                            elif not self.is_first_run:
-                                self._process_and_display_tokens(api_data)
-                        else:
-                            if self.debug:
-                                print(f"⏭️ 忽略非新币请求: {post_data}")
-                            
-                    except Exception as e:
-                        print(f"❌ 解析API响应失败: {e}")
-                        if self.debug:
-                            import traceback
-                            traceback.print_exc()
-            
-            self.page.on("response", handle_response)
+            # 设置网络请求监听器（每个页面只绑定一次）
+            if not self._listener_bound:
+                # 请求发出时识别新币查询，响应到达时只需查表
+                self.page.on("request", self._new_coin_request_marker())
+                # Playwright需要普通Python函数作为监听器（内置方法无法取得签名）
+                self.page.on("requestfailed", lambda request: self._new_requests.discard(request))
+                self.page.on("response", self._only_new_coin_responses(self._on_response))
+                self._listener_bound = True
             
             # 只在调试模式下添加请求监听器
             if self.debug:
@@ -158,6 +176,101 @@ class SparkScraper:
             
             print("✅ 浏览器初始化完成")
     
+    def _new_coin_request_marker(self):
+        """创建请求监听器：标记新币API请求（按URL、请求方法和载荷中的分类判断）
+
+        页面上每个子资源请求都会触发该监听器，热路径用到的属性预先绑定为闭包变量。
+        """
+        api_url = self.config.api_url
+        new_requests = self._new_requests
+        debug = self.debug
+        
+        def on_request(request):
+            if api_url not in request.url or request.method != "POST":
+                return
+            if _is_new_category(request.post_data_buffer):
+                new_requests.add(request)
+            elif debug:
+                print(f"⏭️ 忽略非新币请求: {request.post_data}")
+        
+        return on_request
+    
+    def _only_new_coin_responses(self, handler):
+        """包装响应监听器：只有已标记为新币查询的请求的响应才创建协程任务"""
+        new_requests = self._new_requests
+        
+        def on_response(response):
+            request = response.request
+            if request not in new_requests:
+                return None
+            new_requests.discard(request)
+            return handler(response)
+        
+        return on_response
+    
+    async def _on_response(self, response):
+        """处理新币API响应（唯一的响应监听器，只会收到已标记为新币查询的请求的响应）"""
+        try:
+            if self.debug:
+                print(f"🌐 检测到API请求: {response.url}")
+                print(f"📦 请求载荷: {response.request.post_data}")
+                print(f"📊 响应状态: {response.status}")
+            
+            print(f"🔍 捕获到新币API请求")
+            data = orjson.loads(await response.body())
+            api_data = data.get("data", [])
+            print(f"📈 新币数据：包含 {len(api_data)} 个代币")
+            
+            # 通知等待中的页面访问：API数据已到达
+            self.api_response_data = api_data
+            self._api_ready.set()
+            
+            # 如果是初始化阶段，立即处理并显示前3个代币
+            if self.is_first_run and len(api_data) > 0:
+                print("📊 首次启动，显示最新3个代币...")
+                
+                # 解析所有代币
+                all_tokens = []
+                for item in api_data:
+                    try:
+                        all_tokens.append(Token.from_api_data(item))
+                    except Exception as e:
+                        print(f"处理代币数据失败: {e}")
+                        continue
+                # 全部标记为已见过
+                self.token_store.add_many(all_tokens)
+                
+                # 显示最新的3个
+                if all_tokens:
+                    display_tokens = self.token_store.recent_tokens()
+                    print(f"\n🪙 当前最新的 {len(display_tokens)} 个代币:")
+                    self._print_token_list(display_tokens)
+                    
+                    # 发送启动推送（如果配置了）
+                    if self.bark_notifier.is_enabled() and self.config.bark_push_on_startup:
+                        self._spawn(self._send_startup_notification(display_tokens))
+                
+                # 切换到监听模式
+                self.is_first_run = False
+                print("✨ 初始化完成，切换到监听模式")
+            
+            # 如果是正常监听模式，检查新代币
+            elif not self.is_first_run:
+                self._queue_tokens(api_data)
+        
+        except Exception as e:
+            print(f"[{self._ts()}] ❌ 解析API响应失败: {e}")
+            if self.debug:
+                import traceback
+                traceback.print_exc()
+    
+    async def _handle_route(self, route):
+        """拦截无关资源，其余请求正常放行"""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
     async def fetch_data_via_browser(self) -> Optional[List[dict]]:
         """通过浏览器访问页面获取数据"""
         try:
@@ -165,12 +278,17 @@ class SparkScraper:
             
             print(f"正在访问页面: {self.config.monitor_url}")
             self.api_response_data = None
+            self._api_ready.clear()
             
-            # 访问页面
-            await self.page.goto(self.config.monitor_url, wait_until="networkidle")
+            # 访问页面，DOM就绪即可，不必等待所有网络请求结束；页面卡住时超时抛出异常
+            await self.page.goto(self.config.monitor_url, wait_until="domcontentloaded", timeout=BROWSER_GOTO_TIMEOUT_MS)
             
-            # 等待API调用完成
-            await asyncio.sleep(3)
+            # 等待新币API响应到达，超时只计数并返回None，由调用方改用直接API调用
+            try:
+                await asyncio.wait_for(self._api_ready.wait(), timeout=API_WAIT_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                self.api_wait_timeouts += 1
+                return None
             
             return self.api_response_data
                 
@@ -181,26 +299,59 @@ class SparkScraper:
     async def close_browser(self):
         """关闭浏览器"""
         if self.browser:
+            if self._cdp_connected and self.page is not None:
+                # 连接的是用户自己的Chrome：只关闭本程序打开的标签页，browser.close() 仅断开连接
+                await self.page.close()
             await self.browser.close()
+            self._cdp_connected = False
             self.browser = None
             self.context = None
             self.page = None
+            self._listener_bound = False
+            self._new_requests.clear()
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+    
+    async def __aenter__(self) -> "SparkScraper":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """释放所有资源：浏览器、HTTP会话和Bark推送器"""
+        await self.close_browser()
+        # 处理合并窗口内尚未处理的响应，避免退出前到达的新代币及其推送丢失
+        self._flush_batch()
+        # 等待未完成的推送，再关闭Bark推送器的共享HTTP会话
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+        await self.bark_notifier.aclose()
+    
+    async def _get_http(self) -> "aiohttp.ClientSession":
+        """获取直接调用API用的HTTP会话"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=30),
+                headers={
+                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                    'Accept': 'application/json',
+                    'Referer': self.config.monitor_url
+                }
+            )
+        return self._http
     
     async def fetch_data_direct(self) -> Optional[List[dict]]:
         """直接调用API获取数据"""
         try:
             print(f"直接调用API: {self.config.api_url}")
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-                'Accept': 'application/json',
-                'Referer': self.config.monitor_url
-            }
-            
-            response = requests.get(self.config.api_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            http = await self._get_http()
+            async with http.get(self.config.api_url) as response:
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
             return data.get("data", [])
             
         except Exception as e:
@@ -212,28 +363,27 @@ class SparkScraper:
         if not api_data:
             return [], []
         
-        new_tokens = []
-        all_tokens = []
-        
+        # Token按字段缓存构造，已见过且内容未变的代币直接复用缓存对象
+        # 按代币ID去重（分页重叠时同一响应内可能重复），保留首次出现的顺序；缺少ID的代币按内容去重
+        unique = {}
         for item in api_data:
             try:
                 token = Token.from_api_data(item)
-                all_tokens.append(token)
-                
-                if self.is_first_run:
-                    # 首次运行：显示过去30分钟内创建的代币
-                    if token.is_newly_created(threshold_minutes=30):
-                        new_tokens.append(token)
-                    # 标记所有代币为已见过，避免下次重复显示
-                    self.token_store.add_token(token)
-                else:
-                    # 正常运行：只显示新发现的代币
-                    if self.token_store.is_new_token(token):
-                        new_tokens.append(token)
-                    
             except Exception as e:
                 print(f"处理代币数据失败: {e}")
                 continue
+            unique.setdefault(TokenStore.dedup_key(token), token)
+        all_tokens = list(unique.values())
+        
+        if self.is_first_run:
+            # 首次运行：显示过去30分钟内创建的代币（整批共用同一个当前时间）
+            now = time.time()
+            new_tokens = [token for token in all_tokens if token.is_newly_created(threshold_minutes=30, now=now)]
+            # 标记所有代币为已见过，避免下次重复显示
+            self.token_store.add_many(all_tokens)
+        else:
+            # 正常运行：只显示新发现的代币
+            new_tokens = self.token_store.filter_new_tokens(all_tokens)
         
         return new_tokens, all_tokens
     
@@ -248,9 +398,8 @@ class SparkScraper:
                 print("过去30分钟内没有新创建的代币")
                 if all_tokens:
                     print(f"\n🪙 当前所有代币信息 (显示最新 {min(3, len(all_tokens))} 个):")
-                    # 按创建时间排序，显示最新的3个
-                    sorted_tokens = sorted(all_tokens, key=lambda x: x.token_created_at, reverse=True)
-                    self._print_token_list(sorted_tokens[:3])
+                    # 代币存储中维护了最新的3个
+                    self._print_token_list(self.token_store.recent_tokens())
         else:
             if new_tokens:
                 print(f"\n🎉 发现 {len(new_tokens)} 个新代币:")
@@ -259,35 +408,81 @@ class SparkScraper:
                 print("没有发现新代币")
     
     def _print_token_list(self, tokens: List[Token]):
-        """打印代币列表"""
-        print("-" * 80)
+        """打印代币列表（整体拼接后一次性写出）"""
+        buf = [_SEP]
         for token in tokens:
-            print(f"代币名称: {token.name}")
-            print(f"代币符号: {token.ticker}")
-            print(f"合约地址: {token.token_address}")
-            print(f"创建时间: {token.token_created_at}")
+            buf.append(
+                f"代币名称: {token.name}\n"
+                f"代币符号: {token.ticker}\n"
+                f"合约地址: {token.token_address}\n"
+                f"创建时间: {token.token_created_at}\n"
+            )
             if token.description:
-                print(f"描述: {token.description}")
-            print("-" * 80)
+                buf.append(f"描述: {token.description}\n")
+            buf.append(_SEP)
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
     
     def _process_and_display_tokens(self, api_data: list):
         """处理并显示代币数据"""
         new_tokens, all_tokens = self.process_tokens(api_data)
         
         if new_tokens:
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] 🎉 发现新代币!")
+            print(f"[{self._ts()}] 🎉 发现新代币!")
             self.print_tokens(new_tokens, all_tokens)
             
             # 发送Bark推送通知
             if self.bark_notifier.is_enabled():
-                asyncio.create_task(self._send_new_token_notification(new_tokens))
+                self._spawn(self._send_new_token_notification(new_tokens))
+        else:
+            print(f"[{self._ts()}] 📡 收到新币API响应，暂无符合条件的新代币")
+    
+    def _queue_tokens(self, api_data: list):
+        """将API数据加入待处理批次，短时间内的多次响应合并为一次处理"""
+        self._pending_batch.append(api_data)
+        if len(self._pending_batch) >= BATCH_MAX_RESPONSES:
+            self._flush_batch()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(BATCH_WINDOW_SECONDS, self._flush_batch)
+    
+    def _flush_batch(self):
+        """合并待处理批次（按代币ID去重）并统一处理"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending_batch = self._pending_batch, []
+        if not batch:
+            return
+        
+        if len(batch) == 1:
+            merged = batch[0]
         else:
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] 📡 收到新币API响应，暂无符合条件的新代币")
+            merged_by_id = {}
+            without_id = []  # 缺少ID的条目全部保留，由 process_tokens 按内容去重
+            for api_data in batch:
+                for item in api_data:
+                    token_id = item.get("token", {}).get("id")
+                    if token_id is None:
+                        without_id.append(item)
+                    else:
+                        # 后到的数据覆盖先到的，保留最新状态
+                        merged_by_id[token_id] = item
+            merged = list(merged_by_id.values()) + without_id
+        self._process_and_display_tokens(merged)
+    
+    def _spawn(self, coro):
+        """在后台运行任务并跟踪其生命周期"""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
     
     async def _send_new_token_notification(self, tokens: List[Token]):
         """发送新代币通知"""
         try:
-            success = await self.bark_notifier.send_new_token_message(tokens)
+            async with self._bark_sem:
+                success = await self.bark_notifier.send_new_token_message(tokens)
             if success:
                 print(f"📱 已推送新代币通知")
             else:
@@ -298,7 +493,8 @@ class SparkScraper:
     async def _send_startup_notification(self, tokens: List[Token]):
         """发送启动通知"""
         try:
-            success = await self.bark_notifier.send_startup_message(tokens)
+            async with self._bark_sem:
+                success = await self.bark_notifier.send_startup_message(tokens)
             if success:
                 print(f"📱 已推送启动通知")
             elif self.debug:
@@ -309,16 +505,16 @@ class SparkScraper:
     async def run_once(self):
         """执行一次监控"""
         if self.is_first_run:
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] 首次启动，检查过去30分钟内的新代币...")
+            print(f"[{self._ts()}] 首次启动，检查过去30分钟内的新代币...")
         else:
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] 开始检查新代币...")
+            print(f"[{self._ts()}] 开始检查新代币...")
         
         # 首先尝试浏览器方式
         api_data = await self.fetch_data_via_browser()
         
         # 如果浏览器方式失败，尝试直接API调用
         if api_data is None:
-            print("浏览器方式失败，尝试直接API调用...")
+            print(f"浏览器方式失败（累计等待API超时 {self.api_wait_timeouts} 次），尝试直接API调用...")
             api_data = await self.fetch_data_direct()
         
         if api_data is None:
@@ -343,21 +539,29 @@ class SparkScraper:
         print("👂 监听模式：持续监听网页自动执行的API请求")
         print("=" * 80)
         
+        loop = asyncio.get_running_loop()
         try:
             # 初始化浏览器并保持打开状态
             await self.init_browser()
             
             # 首次访问页面获取初始数据
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] 首次启动，等待网页加载...")
+            print(f"[{self._ts()}] 首次启动，等待网页加载...")
             if self.debug:
                 print(f"🌐 目标URL: {self.config.monitor_url}")
             
             try:
                 if self.debug:
                     print("📡 开始加载页面...")
-                await self.page.goto(self.config.monitor_url, wait_until="networkidle", timeout=60000)
+                self._api_ready.clear()
+                await self.page.goto(self.config.monitor_url, wait_until="domcontentloaded", timeout=STARTUP_GOTO_TIMEOUT_MS)
                 print("✅ 页面加载完成，监听器已激活")
                 
+                # 等待首个新币API响应，而不是等待网络完全空闲
+                try:
+                    await asyncio.wait_for(self._api_ready.wait(), timeout=STARTUP_API_WAIT_SECONDS)
+                except asyncio.TimeoutError:
+                    print("⏳ 暂未捕获到新币API响应，继续监听")
+                
                 if self.debug:
                     # 检查页面状态
                     title = await self.page.title()
@@ -393,44 +597,29 @@ class SparkScraper:
             print("💡 网页会自动刷新并执行API请求，无需手动干预")
             print("⏹️  按 Ctrl+C 退出监控\n")
             
-            # 设置API响应监听器处理新数据
-            async def handle_response(response):
-                if self.config.api_url in response.url:
-                    try:
-                        # 获取请求的载荷
-                        request = response.request
-                        post_data = request.post_data
-                        
-                        # 只处理新币请求
-                        if post_data and '"category":"new"' in post_data:
-                            print(f"🔍 捕获到新币API请求")
-                            data = await response.json()
-                            api_data = data.get("data", [])
-                            print(f"📈 新币数据：包含 {len(api_data)} 个代币")
-                            
-                            # 处理数据并显示结果
-                            self._process_and_display_tokens(api_data)
-                        else:
-                            # 忽略非新币请求，静默处理
-                            pass
-                            
-                    except Exception as e:
-                        print(f"[{datetime.now().strftime('%H:%M:%S')}] 解析API响应失败: {e}")
-            
-            # 重新绑定响应监听器
-            self.page.on("response", handle_response)
-            
-            # 保持程序运行，持续监听
-            while True:
-                await asyncio.sleep(1)  # 保持事件循环运行
+            # 保持程序运行，持续监听，直到收到退出信号
+            try:
+                for sig in SHUTDOWN_SIGNALS:
+                    loop.add_signal_handler(sig, self._shutdown.set)
+            except NotImplementedError:
+                # Windows不支持add_signal_handler，仍由KeyboardInterrupt处理
+                pass
+            await self._shutdown.wait()
+            print("\n👋 用户中断，程序退出")
                     
         except KeyboardInterrupt:
             print("\n👋 用户中断，程序退出")
         except Exception as e:
             print(f"❌ 运行出错: {e}")
         finally:
-            # 确保浏览器被正确关闭
-            await self.close_browser()
+            # 恢复默认的信号处理，清理过程中再次按 Ctrl+C 可以强制中断
+            for sig in SHUTDOWN_SIGNALS:
+                try:
+                    loop.remove_signal_handler(sig)
+                except NotImplementedError:
+                    pass
+            # 确保浏览器等资源被正确关闭
+            await self.aclose()
             print("🔧 浏览器已关闭")
 
 
@@ -442,6 +631,9 @@ async def main():
     parser.add_argument('--debug', action='store_true', help='启用调试模式，输出详细日志')
     args = parser.parse_args()
     
+    if args.debug:
+        enable_debug_logging()
+    
     # 加载配置
     config = Config.from_env()
     
@@ -449,11 +641,9 @@ async def main():
     if args.headless:
         config.browser_headless = True
     
-    # 创建爬虫实例
-    scraper = SparkScraper(config, debug=args.debug)
-    
-    # 运行
-    await scraper.run_continuous()
+    # 创建爬虫实例并运行，退出时释放所有资源
+    async with SparkScraper(config, debug=args.debug) as scraper:
+        await scraper.run_continuous()
 
 
 if __name__ == "__main__":
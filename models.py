@@ -1,67 +1,179 @@
 """数据模型"""
-from dataclasses import dataclass
+import functools
+import heapq
+import itertools
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from ciso8601 import parse_datetime
+from typing import Any, ClassVar, Dict, Hashable, Iterable, Iterator, List, Optional
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Token:
-    """代币信息"""
+    """代币信息（不可变，可哈希，按全部字段比较相等）"""
     token_id: int
     name: str
     ticker: str
     token_address: str
     token_created_at: str
     description: Optional[str] = None
+    # 以下字段由 token_created_at 解析得到
+    created_datetime: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    created_ts: float = field(default=0.0, init=False, repr=False, compare=False)  # Unix时间戳，用于排序和比较
     
     def __post_init__(self):
         """格式化创建时间"""
         if isinstance(self.token_created_at, str):
             try:
-                # 解析ISO时间格式
-                self.created_datetime = datetime.fromisoformat(
-                    self.token_created_at.replace('Z', '+00:00')
-                )
+                # 解析ISO时间格式（frozen 下派生字段只能在这里通过 object.__setattr__ 写入）
+                created_datetime = parse_datetime(self.token_created_at)
             except ValueError:
-                self.created_datetime = None
+                return
+            object.__setattr__(self, "created_datetime", created_datetime)
+            object.__setattr__(self, "created_ts", created_datetime.timestamp())
     
     @classmethod
     def from_api_data(cls, data: Dict[str, Any]) -> "Token":
         """从API数据创建Token对象"""
         token_data = data.get("token", {})
-        return cls(
-            token_id=token_data.get("id"),
-            name=token_data.get("name"),
-            ticker=token_data.get("ticker"),
-            token_address=token_data.get("token_address"),
-            token_created_at=token_data.get("token_created_at"),
-            description=token_data.get("description")
+        # 相同的代币数据复用已解析的Token，跳过重复的时间解析
+        return _build_token(
+            token_data.get("id"),
+            token_data.get("name"),
+            token_data.get("ticker"),
+            token_data.get("token_address"),
+            token_data.get("token_created_at"),
+            token_data.get("description")
         )
     
-    def is_newly_created(self, threshold_minutes: int = 30) -> bool:
-        """判断是否是新创建的代币（在threshold_minutes分钟内创建）"""
+    def is_newly_created(self, threshold_minutes: int = 30, *, now: Optional[float] = None) -> bool:
+        """判断是否是新创建的代币（在threshold_minutes分钟内创建）
+
+        批量判断时由调用方传入同一个 now（Unix时间戳），避免每个代币都取一次当前时间。
+        """
         if not self.created_datetime:
             return False
         
-        now = datetime.now(self.created_datetime.tzinfo)
-        time_diff = now - self.created_datetime
-        return time_diff.total_seconds() < threshold_minutes * 60
+        if now is None:
+            now = time.time()
+        return now - self.created_ts < threshold_minutes * 60
+
+@functools.lru_cache(maxsize=4096)
+def _build_token(token_id, name, ticker, token_address, token_created_at, description) -> Token:
+    """按字段缓存Token对象，轮询中重复出现的代币直接复用"""
+    return Token(
+        token_id=token_id,
+        name=name,
+        ticker=ticker,
+        token_address=token_address,
+        token_created_at=token_created_at,
+        description=description
+    )
 
-@dataclass  
+@dataclass(slots=True)
 class TokenStore:
-    """代币存储管理"""
-    seen_tokens: set[int]
+    """代币存储管理
+
+    已见过的代币按ID保存在容量为 capacity 的LRU中，超出后淘汰最久未出现的ID，内存占用保持恒定。
+    先按ID做集合检查；ID已存在时再比较Token本身，同一ID下内容变化的代币也视为新代币。
+    缺少ID的代币以Token本身为键，按内容去重。
+    """
+    seen_tokens: OrderedDict[Hashable, Token]
+    capacity: int
+    # 最新的几个代币：(created_ts, 序号, token) 组成的小顶堆，序号用于时间相同时的比较
+    _recent: list[tuple[float, int, Token]]
+    _recent_seq: Iterator[int]
+    
+    RECENT_SIZE: ClassVar[int] = 3  # 保留的最新代币数量
+    
+    def __init__(self, capacity: int = 16384):
+        self.capacity = capacity
+        self.seen_tokens = OrderedDict()
+        self._recent = []
+        self._recent_seq = itertools.count()
+    
+    @staticmethod
+    def dedup_key(token: Token) -> Hashable:
+        """去重用的键：有ID时为代币ID，缺少ID时为Token本身"""
+        return token.token_id if token.token_id is not None else token
     
-    def __init__(self):
-        self.seen_tokens = set()
+    def _evict(self):
+        """淘汰超出容量的最久未出现的代币"""
+        while len(self.seen_tokens) > self.capacity:
+            self.seen_tokens.popitem(last=False)
+    
+    def _track_recent(self, token: Token):
+        """维护最新代币的小顶堆"""
+        key = self.dedup_key(token)
+        entry = (token.created_ts, next(self._recent_seq), token)
+        # 被淘汰后重新出现、或内容有变化的代币可能已在堆中：内容相同则保留，否则替换为新的Token
+        for i, (_, _, old) in enumerate(self._recent):
+            if self.dedup_key(old) == key:
+                if old != token:
+                    self._recent[i] = entry
+                    heapq.heapify(self._recent)
+                return
+        if len(self._recent) < self.RECENT_SIZE:
+            heapq.heappush(self._recent, entry)
+        elif entry > self._recent[0]:
+            heapq.heapreplace(self._recent, entry)
+    
+    def recent_tokens(self) -> List[Token]:
+        """返回已记录的最新代币（按创建时间从新到旧）"""
+        return [entry[2] for entry in sorted(self._recent, reverse=True)]
     
     def is_new_token(self, token: Token) -> bool:
-        """检查是否是新代币"""
-        if token.token_id in self.seen_tokens:
+        """检查是否是新代币（ID未见过，或同一ID下内容有变化）"""
+        key = self.dedup_key(token)
+        seen = self.seen_tokens.get(key)
+        # Token按字段缓存构造，内容未变时通常是同一个对象，先做身份比较
+        if seen is not None and (seen is token or seen == token):
+            self.seen_tokens.move_to_end(key)
             return False
         
-        self.seen_tokens.add(token.token_id)
+        self.seen_tokens[key] = token
+        self.seen_tokens.move_to_end(key)
+        self._evict()
+        self._track_recent(token)
         return True
     
+    def add_many(self, tokens: Iterable[Token]) -> set[Hashable]:
+        """批量标记代币为已见过，返回其中新代币（或内容有变化的代币）的去重键"""
+        by_key = {}
+        for token in tokens:
+            by_key.setdefault(self.dedup_key(token), token)
+        seen = self.seen_tokens
+        # 一次集合差集找出未见过的键，只有ID冲突的才逐个比较Token本身
+        new_keys = by_key.keys() - seen.keys()
+        for key in by_key.keys() - new_keys:
+            old = seen[key]
+            if old is not by_key[key] and old != by_key[key]:
+                new_keys.add(key)
+        
+        for key, token in by_key.items():
+            seen[key] = token
+            seen.move_to_end(key)
+        self._evict()
+        for key in new_keys:
+            self._track_recent(by_key[key])
+        return new_keys
+    
+    def filter_new_tokens(self, tokens: List[Token]) -> List[Token]:
+        """批量筛选新代币并标记为已见过"""
+        new_keys = self.add_many(tokens)
+        if not new_keys:
+            return []
+        
+        new_tokens = []
+        for token in tokens:
+            # 同一批次内重复出现的代币只保留第一次
+            key = self.dedup_key(token)
+            if key in new_keys:
+                new_keys.discard(key)
+                new_tokens.append(token)
+        return new_tokens
+    
     def add_token(self, token: Token):
         """添加代币到已知集合"""
-        self.seen_tokens.add(token.token_id)
\ No newline at end of file
+        self.is_new_token(token)
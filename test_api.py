@@ -11,15 +11,16 @@ async def test_api_call():
     print(f"测试API调用: {api_url}")
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Accept': 'application/json'
-        }
-        
-        response = requests.get(api_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        with requests.Session() as session:
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+                'Accept': 'application/json'
+            })
+            
+            response = session.get(api_url, timeout=10)
+            response.raise_for_status()
+            
+            data = response.json()
         tokens = data.get("data", [])
         
         print(f"✅ API调用成功，获取到 {len(tokens)} 个代币")